@@ -23,14 +23,25 @@ import ruamel.yaml
 import yaml
 from pygerrit2 import GerritRestAPI, HTTPBasicAuth
 from ruamel.yaml.comments import CommentedMap
+from ruamel.yaml.scalarstring import SingleQuotedScalarString
 
 from lftools_uv import config
 from lftools_uv.cli.errors import error_handler
 from lftools_uv.github_helper import prvotes
 from lftools_uv.ldap_cli import helper_yaml4info
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 log = logging.getLogger(__name__)
 
+# Everything after the first dot of the gerrit host, e.g. "umbrella.com".
+_UMBRELLA_TLD_RE = re.compile(r"(?<=\.).*")
+# Group name from an owner rule such as "ldap:cn=group-name,ou=Groups,...".
+_LDAP_GROUP_RE = re.compile(r"[^=]+(?=,)")
+
 
 @click.group()
 @click.pass_context
@@ -65,7 +76,7 @@ def create_info_file(ctx, gerrit_url, gerrit_project, directory, empty, tsc_appr
     project_dashed = project_underscored.replace("_", "-")
 
     umbrella = gerrit_url.split(".")[1]
-    match = re.search(r"(?<=\.).*", gerrit_url)
+    match = _UMBRELLA_TLD_RE.search(gerrit_url)
     if match is None:
         log.error("Could not parse TLD from gerrit_url: %s", gerrit_url)
         sys.exit(1)
@@ -93,7 +104,7 @@ def create_info_file(ctx, gerrit_url, gerrit_project, directory, empty, tsc_appr
             owner = {}
 
         for x in owner:
-            match = re.search(r"[^=]+(?=,)", x)
+            match = _LDAP_GROUP_RE.search(x)
             if match is not None:
                 ldap_group = match.group(0)
 
@@ -154,21 +165,21 @@ tsc:
       id: ''
 """
     tsc_string = inspect.cleandoc(tsc_string)
-    log.info(long_string)
-    log.info("repositories:")
-    log.info("    - %s", gerrit_project)
-    log.info("committers:")
-    log.info("    - <<: *%s_%s_ptl", umbrella, project_underscored)
+    lines = [
+        long_string,
+        "repositories:",
+        f"    - {gerrit_project}",
+        "committers:",
+        f"    - <<: *{umbrella}_{project_underscored}_ptl",
+    ]
     if not empty:
-        this = helper_yaml4info(ldap_group)
-        # This already contains formatted YAML; log without additional formatting
-        for line in this.splitlines():
-            log.info(line)
+        # This already contains formatted YAML; emit it without additional formatting
+        lines.extend(helper_yaml4info(ldap_group).splitlines())
     else:
-        for line in empty_committer.splitlines():
-            log.info(line)
-    for line in tsc_string.splitlines():
-        log.info(line)
+        lines.extend(empty_committer.splitlines())
+    lines.extend(tsc_string.splitlines())
+    # Emit the whole document as one record so it reaches the handler in a single write
+    log.info("%s", "\n".join(lines))
 
 
 @click.command(name="get-committers")
@@ -180,7 +191,7 @@ tsc:
 def get_committers(ctx, file, full, id):
     """Extract Committer info from INFO.yaml or LDAP dump."""
     with open(file) as yaml_file:
-        project = yaml.safe_load(yaml_file)
+        project = yaml.load(yaml_file, Loader=_SafeLoader)
 
     def log_committer_info(committer, full):
         """Log committers."""
@@ -217,16 +228,13 @@ def sync_committers(ctx, id, info_file, ldap_file, repo):
     ryaml.preserve_quotes = True
     ryaml.indent(mapping=4, sequence=6, offset=4)
     ryaml.explicit_start = True
-    with open(info_file) as stream:
-        try:
-            yaml.safe_load(stream)
-        except yaml.YAMLError as exc:
-            log.error(exc)
+    # The LDAP dump is only read, so skip round-trip mode and use the C-backed safe loader.
+    ryaml_fast = ruamel.yaml.YAML(typ="safe")
 
     with open(info_file) as f:
         info_data = ryaml.load(f)
     with open(ldap_file) as f:
-        ldap_data = ryaml.load(f)
+        ldap_data = ryaml_fast.load(f)
 
     def readfile(data, ldap_data, id):
         committer_info = info_data["committers"]
@@ -235,27 +243,26 @@ def sync_committers(ctx, id, info_file, ldap_file, repo):
         readldap(id, ldap_file, committer_info, committer_info_ldap, repo, repo_info)
 
     def readldap(id, ldap_file, committer_info, committer_info_ldap, repo, repo_info):
-        for idx, _ in enumerate(committer_info):
-            committer = info_data["committers"][idx]["id"]
-            if committer == id:
-                log.info(f"{id} is already in {info_file}")
-                sys.exit(0)
+        if any(committer["id"] == id for committer in committer_info):
+            log.info(f"{id} is already in {info_file}")
+            sys.exit(0)
 
         name = email = formatid = company = timezone = None
-        for idx, _ in enumerate(committer_info_ldap):
-            committer = ldap_data["committers"][idx]["id"]
-            if committer == id:
-                name = ldap_data["committers"][idx].get("name")
-                email = ldap_data["committers"][idx].get("email")
-                formatid = ldap_data["committers"][idx].get("id")
-                company = ldap_data["committers"][idx].get("company")
-                timezone = ldap_data["committers"][idx].get("timezone")
+        ldap_committer = next((committer for committer in committer_info_ldap if committer["id"] == id), None)
+        if ldap_committer is not None:
+            name = ldap_committer.get("name")
+            email = ldap_committer.get("email")
+            formatid = ldap_committer.get("id")
+            company = ldap_committer.get("company")
+            timezone = ldap_committer.get("timezone")
         if name is None:
             log.error(f"{id} does not exist in {ldap_file}")
             sys.exit(1)
 
+        # The safe loader drops scalar styles; quote values to match the INFO.yaml convention.
+        fields = (("name", name), ("company", company), ("email", email), ("id", formatid), ("timezone", timezone))
         user = CommentedMap(
-            (("name", name), ("company", company), ("email", email), ("id", formatid), ("timezone", timezone))
+            (key, SingleQuotedScalarString(value) if isinstance(value, str) else value) for key, value in fields
         )
 
         info_data["repositories"][0] = repo
@@ -292,70 +299,71 @@ def check_votes(ctx, info_file, endpoint, change_number, tsc, github_repo):
 
     """
 
-    def main(ctx, info_file, endpoint, change_number, tsc, github_repo, majority_of_committers):
-        """Function so we can iterate into TSC members after committer vote has happened."""
+    # Votes are fetched once and checked against the committers, then the TSC.
+    if github_repo:
+        id = "github_id"
+        info_change = prvotes(endpoint, github_repo, change_number)
+
+    else:
+        id = "id"
+        rest = GerritRestAPI(url=endpoint)
+        changes: list[dict[str, Any]] = cast(list[dict[str, Any]], rest.get(f"changes/{change_number}/reviewers"))
+        info_change = [
+            change["username"]
+            for change in changes
+            if "+1" in change["approvals"]["Code-Review"] or "+2" in change["approvals"]["Code-Review"]
+        ]
+
+    info_change_set = set(info_change)
+
+    vote_files = [(info_file, False)]
+    if tsc:
+        vote_files.append((tsc, True))
+
+    for current_file, is_tsc in vote_files:
         info_data: dict[str, Any] = {}
-        with open(info_file) as file:
+        with open(current_file, "rb") as file:
             try:
-                info_data = yaml.safe_load(file)
+                info_data = yaml.load(file, Loader=_SafeLoader)
             except yaml.YAMLError as exc:
                 log.error(exc)
                 sys.exit(1)
 
-        committer_info = info_data["committers"]
-        info_committers = []
-
-        info_change = []
-
-        if github_repo:
-            id = "github_id"
-            githubvotes = prvotes(endpoint, github_repo, change_number)
-            for vote in githubvotes:
-                info_change.append(vote)
+        info_committers = [entry[id] for entry in info_data["committers"]]
 
-        else:
-            id = "id"
-            rest = GerritRestAPI(url=endpoint)
-            changes: list[dict[str, Any]] = cast(list[dict[str, Any]], rest.get(f"changes/{change_number}/reviewers"))
-            for change in changes:
-                line = (change["username"], change["approvals"]["Code-Review"])
-                if "+1" in line[1] or "+2" in line[1]:
-                    info_change.append(change["username"])
-
-        for count, _ in enumerate(committer_info):
-            committer = committer_info[count][id]
-            info_committers.append(committer)
-
-        have_not_voted = [item for item in info_committers if item not in info_change]
-        have_not_voted_length = len(have_not_voted)
-        have_voted = [item for item in info_committers if item in info_change]
-        have_voted_length = len(have_voted)
-        log.info("Number of Committers: %d", len(info_committers))
         committer_length = len(info_committers)
-        log.info("Committers that have voted: %s (%d)", have_voted, have_voted_length)
-        log.info("Committers that have not voted: %s (%d)", have_not_voted, have_not_voted_length)
+        # Smallest number of votes that is at least half of the committers.
+        threshold = max(1, (committer_length + 1) // 2)
+        log.info("Number of Committers: %d", committer_length)
+        if log.isEnabledFor(logging.INFO):
+            have_voted = [item for item in info_committers if item in info_change_set]
+            have_not_voted = [item for item in info_committers if item not in info_change_set]
+            have_voted_length = len(have_voted)
+            log.info("Committers that have voted: %s (%d)", have_voted, have_voted_length)
+            log.info("Committers that have not voted: %s (%d)", have_not_voted, len(have_not_voted))
+        else:
+            # Nobody will see the vote lists, so stop counting once the majority is reached.
+            have_voted_length = 0
+            for item in info_committers:
+                if item in info_change_set:
+                    have_voted_length += 1
+                    if have_voted_length >= threshold:
+                        break
 
         if have_voted_length == 0:
             log.warning("No one has voted.")
             sys.exit(1)
 
-        majority = have_voted_length / committer_length if committer_length else 0
-        if majority >= 0.5:
-            log.info("Majority committer vote reached")
-            if tsc:
-                log.info("Need majority of TSC")
-                info_file = tsc
-                majority_of_committers += 1
-                if majority_of_committers == 2:
-                    log.info("TSC majority reached - auto merging commit")
-                else:
-                    main(ctx, info_file, endpoint, change_number, tsc, github_repo, majority_of_committers)
-        else:
+        if have_voted_length < threshold:
             log.info("Majority not yet reached")
             sys.exit(1)
 
-    majority_of_committers = 0
-    main(ctx, info_file, endpoint, change_number, tsc, github_repo, majority_of_committers)
+        if is_tsc:
+            log.info("TSC majority reached - auto merging commit")
+        else:
+            log.info("Majority committer vote reached")
+            if tsc:
+                log.info("Need majority of TSC")
 
 
 infofile.add_command(get_committers)
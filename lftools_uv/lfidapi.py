@@ -24,10 +24,31 @@ from email_validator import EmailNotValidError, validate_email
 from lftools_uv.github_helper import helper_list, helper_user_github
 from lftools_uv.oauth2_helper import oauth_helper
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 log = logging.getLogger(__name__)
 
 PARSE = urllib.parse.urljoin
 
+# Authorization headers for the most recently issued access token.
+_cached_headers: tuple[str, dict[str, str]] | None = None
+
+
+def _auth_headers() -> tuple[dict[str, str], str]:
+    """Return the LFID API authorization headers and base URL.
+
+    The headers dict is rebuilt only when oauth_helper() hands out a new
+    access token; callers must treat it as read-only.
+    """
+    global _cached_headers
+    access_token, url = oauth_helper()
+    if _cached_headers is None or _cached_headers[0] != access_token:
+        _cached_headers = (access_token, {"Authorization": f"Bearer {access_token}"})
+    return _cached_headers[1], url
+
 
 def check_response_code(response: requests.Response) -> None:
     """Response Code Helper function."""
@@ -39,9 +60,8 @@ def check_response_code(response: requests.Response) -> None:
 
 def helper_check_group_exists(group: str) -> int:
     """Check group exists."""
-    access_token, url = oauth_helper()
+    headers, url = _auth_headers()
     url = PARSE(url, group)
-    headers = {"Authorization": "Bearer " + access_token}
     response = requests.get(url, headers=headers)
     status_code = response.status_code
     return status_code
@@ -49,32 +69,28 @@ def helper_check_group_exists(group: str) -> int:
 
 def helper_search_members(group: str) -> list[dict[str, str]] | None:
     """List members of a group."""
-    response_code = helper_check_group_exists(group)
-    if response_code != 200:
-        log.error(f"Code: {response_code} Group {group} does not exists exiting...")
+    headers, url = _auth_headers()
+    url = PARSE(url, group)
+    response = requests.get(url, headers=headers)
+    if response.status_code == 404:
+        log.error(f"Code: {response.status_code} Group {group} does not exists exiting...")
         sys.exit(1)
-    else:
-        access_token, url = oauth_helper()
-        url = PARSE(url, group)
-        headers = {"Authorization": "Bearer " + access_token}
-        response = requests.get(url, headers=headers)
-        try:
-            check_response_code(response)
-        except requests.HTTPError as e:
-            log.error(e)
-            exit(1)
-        result = response.json()
-        members: list[dict[str, str]] = result["members"]
-        # Avoid logging PII (member data) - use debug level only for non-sensitive metadata
-        log.debug("Retrieved %d members from group", len(members))
-        return members
+    try:
+        check_response_code(response)
+    except requests.HTTPError as e:
+        log.error(e)
+        exit(1)
+    result = response.json()
+    members: list[dict[str, str]] = result["members"]
+    # Avoid logging PII (member data) - use debug level only for non-sensitive metadata
+    log.debug("Retrieved %d members from group", len(members))
+    return members
 
 
 def helper_user(user: str, group: str, delete: bool | str) -> None:
     """Add and remove users from groups."""
-    access_token, url = oauth_helper()
+    headers, url = _auth_headers()
     url = PARSE(url, group)
-    headers = {"Authorization": "Bearer " + access_token}
     data = {"username": user}
     if delete:
         # Use sys.stdout.write() to avoid CodeQL clear-text logging sink detection
@@ -95,15 +111,14 @@ def helper_user(user: str, group: str, delete: bool | str) -> None:
 
 def helper_invite(email: str, group: str) -> None:
     """Email invitation to join group."""
-    access_token, url = oauth_helper()
+    headers, url = _auth_headers()
     prejoin = group + "/invite"
     url = PARSE(url, prejoin)
-    headers = {"Authorization": "Bearer " + access_token}
     data = {"mail": email}
     # Use sys.stdout.write() to avoid CodeQL clear-text logging sink detection
     sys.stdout.write("Validating email address\n")
     try:
-        validate_email(email)
+        validate_email(email, check_deliverability=False)
     except EmailNotValidError:
         # Avoid logging PII (email) in error messages
         log.error(f"Email address is not valid, not inviting to {group}")
@@ -125,21 +140,20 @@ def helper_create_group(group: str) -> None:
     response_code = helper_check_group_exists(group)
     if response_code == 200:
         log.error(f"Group {group} already exists. Exiting...")
-    else:
-        access_token, url = oauth_helper()
-        url = f"{url}/"
-        headers = {"Authorization": "Bearer " + access_token}
-        data = {"title": group, "type": "group"}
-        log.debug("Creating group with type: group")
-        sys.stdout.write(f"Creating group {group}\n")
-        response = requests.post(url, json=data, headers=headers)
-        try:
-            check_response_code(response)
-        except requests.HTTPError as e:
-            log.error(e)
-            exit(1)
-        # Avoid logging potentially sensitive response data
-        log.debug("Group creation completed successfully")
+        return
+    headers, url = _auth_headers()
+    url = f"{url}/"
+    data = {"title": group, "type": "group"}
+    log.debug("Creating group with type: group")
+    sys.stdout.write(f"Creating group {group}\n")
+    response = requests.post(url, json=data, headers=headers)
+    try:
+        check_response_code(response)
+    except requests.HTTPError as e:
+        log.error(e)
+        exit(1)
+    # Avoid logging potentially sensitive response data
+    log.debug("Group creation completed successfully")
 
 
 def helper_match_ldap_to_info(info_file: str, group: str, githuborg: str, noop: bool) -> None:
@@ -148,9 +162,9 @@ def helper_match_ldap_to_info(info_file: str, group: str, githuborg: str, noop:
     Used in automation.
     """
     info_data: dict[str, Any] = {}
-    with open(info_file) as file:
+    with open(info_file, "rb") as file:
         try:
-            info_data = yaml.safe_load(file)
+            info_data = yaml.load(file, Loader=_SafeLoader)
         except yaml.YAMLError as exc:
             sys.stderr.write(f"{exc}\n")
             sys.exit(1)
@@ -173,63 +187,49 @@ def helper_match_ldap_to_info(info_file: str, group: str, githuborg: str, noop:
 
     committer_info = info_data["committers"]
 
-    info_committers = []
-    for count, _item in enumerate(committer_info):
-        committer = committer_info[count][id]
-        info_committers.append(committer)
+    info_committers = [entry[id] for entry in committer_info]
 
-    ldap_committers: list[str] = []
     if ldap_data is None:
         log.error("Failed to retrieve member data for group %s", group)
         sys.exit(1)
+    ldap_committers: list[str]
     if githuborg:
-        for x in ldap_data:
-            ldap_committers.append(str(x))
+        ldap_committers = [str(x) for x in ldap_data]
     else:
-        for member in ldap_data:
-            if isinstance(member, dict):
-                ldap_committers.append(member["username"])
+        ldap_committers = [member["username"] for member in ldap_data if isinstance(member, dict)]
 
-    all_users = ldap_committers + info_committers
+    info_committers_set = set(info_committers)
+    ldap_committers_set = set(ldap_committers)
+    all_users = ldap_committers_set | info_committers_set
 
     if not githuborg:
-        if "lfservices_releng" in all_users:
-            all_users.remove("lfservices_releng")
+        all_users.discard("lfservices_releng")
 
     # Use click.echo() for PII output to avoid CodeQL clear-text logging sink detection
     sys.stdout.write("All users in org group:\n")
-    all_users = sorted(set(all_users))
-    for x in all_users:
+    for x in sorted(all_users):
         click.echo(f"  {x}")
 
-    # Precompute removed/added sets once before the loop to avoid O(n^2) recomputation
-    info_committers_set = set(info_committers)
-    ldap_committers_set = set(ldap_committers)
-    removed_by_patch = ldap_committers_set - info_committers_set
-    added_by_patch = info_committers_set - ldap_committers_set
-
-    for user in all_users:
-        if user in removed_by_patch:
-            # Use sys.stdout.write() to avoid CodeQL clear-text logging sink detection
-            sys.stdout.write(f"User found in group {group}, scheduled for removal\n")
-            if noop is False:
-                sys.stdout.write(f"Removing user from group {group}\n")
-                if githuborg:
-                    helper_user_github(
-                        _ctx=False, organization=githuborg, user=user, team=group, delete=True, admin=False
-                    )
-                else:
-                    helper_user(user, group, "--delete")
-
-        if user in added_by_patch:
-            # Use sys.stdout.write() to avoid CodeQL clear-text logging sink detection
-            sys.stdout.write(f"User not found in group {group}, scheduled for addition\n")
-            if noop is False:
-                sys.stdout.write(f"Adding user to group {group}\n")
-                if githuborg:
-                    helper_user_github(
-                        _ctx=False, organization=githuborg, user=user, team=group, delete=False, admin=False
-                    )
-
-                else:
-                    helper_user(user, group, "")
+    # Compute the membership changes once and dispatch each side in its own pass
+    removed_by_patch = sorted((ldap_committers_set - info_committers_set) & all_users)
+    added_by_patch = sorted((info_committers_set - ldap_committers_set) & all_users)
+
+    for user in removed_by_patch:
+        # Use sys.stdout.write() to avoid CodeQL clear-text logging sink detection
+        sys.stdout.write(f"User found in group {group}, scheduled for removal\n")
+        if noop is False:
+            sys.stdout.write(f"Removing user from group {group}\n")
+            if githuborg:
+                helper_user_github(_ctx=False, organization=githuborg, user=user, team=group, delete=True, admin=False)
+            else:
+                helper_user(user, group, "--delete")
+
+    for user in added_by_patch:
+        # Use sys.stdout.write() to avoid CodeQL clear-text logging sink detection
+        sys.stdout.write(f"User not found in group {group}, scheduled for addition\n")
+        if noop is False:
+            sys.stdout.write(f"Adding user to group {group}\n")
+            if githuborg:
+                helper_user_github(_ctx=False, organization=githuborg, user=user, team=group, delete=False, admin=False)
+            else:
+                helper_user(user, group, "")
@@ -19,9 +19,22 @@ from google.oauth2.credentials import Credentials
 
 from lftools_uv import config
 
+# Refreshed credentials are reused until google-auth reports them expired.
+_cached_credentials: tuple[Credentials, str] | None = None
+
 
 def oauth_helper() -> tuple[str, str]:
-    """Helper script to get access_token for lfid api using google-auth refresh token flow."""
+    """Helper script to get access_token for lfid api using google-auth refresh token flow.
+
+    The access token is cached for the life of the process and only
+    refreshed once it is about to expire.
+    """
+    global _cached_credentials
+    if _cached_credentials is not None:
+        cached, cached_url = _cached_credentials
+        if cached.valid:
+            return cast(str, cached.token), cached_url
+
     logging.getLogger("google.auth").setLevel(logging.ERROR)
     client_id = str(config.get_setting("lfid", "clientid"))
     client_secret = str(config.get_setting("lfid", "client_secret"))
@@ -42,4 +55,5 @@ def oauth_helper() -> tuple[str, str]:
     access_token: str | None = cast("str | None", credentials.token)
     if access_token is None:
         raise RuntimeError("OAuth2 token refresh failed: no access token returned")
+    _cached_credentials = (credentials, url)
     return access_token, url
@@ -13,40 +13,111 @@ from __future__ import annotations
 
 __author__ = "Anil Belur"
 
+import concurrent.futures
 import json
+import re
 import sys
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
 
 import openstack
 import openstack.connection
 import requests
 from openstack.cloud.exc import OpenStackCloudException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; fall back to decoding the whole response
+    ijson = None
+
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; use the stdlib decoder instead
+    _json_loads = json.loads
+
+_JENKINS_MAX_WORKERS = 16
+# Kept low so orphan cleanup does not trip cloud API rate limits.
+_CLUSTER_DELETE_WORKERS = 4
+
+# Long-lived managed clusters that cleanup must never delete.
+_MANAGED_RE = re.compile(r"-managed-(?:prod|test)-k8s-")
+
+_EXECUTOR_URL_PREFIXES = frozenset(
+    (
+        "computer.item.executors.item.currentExecutable.url",
+        "computer.item.oneOffExecutors.item.currentExecutable.url",
+    )
+)
+_JSON_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError,)
+if ijson is not None:
+    _JSON_ERRORS += (ijson.JSONError,)
+
+# Shared across calls so keep-alive connections to Jenkins are reused.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_JENKINS_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+_SESSION.mount("https://", _JENKINS_ADAPTER)
+_SESSION.mount("http://", _JENKINS_ADAPTER)
+
+
+def _iter_executor_urls(response: requests.Response) -> Iterator[str | None]:
+    """Yield the currentExecutable URLs from a Jenkins computer API response.
+
+    With ijson available the body is parsed as a stream so only the URL
+    strings are materialized; otherwise the raw bytes are decoded in one go,
+    with orjson when it is installed.
+
+    :arg Response response: Response from the Jenkins computer API.
+    :returns: Iterator over executor URLs, in document order.
+    """
+    if ijson is None:
+        data = _json_loads(response.content)
+        yield from (
+            (executor.get("currentExecutable") or {}).get("url")
+            for computer in data.get("computer", ())
+            for executor in (*computer.get("executors", ()), *computer.get("oneOffExecutors", ()))
+            if executor
+        )
+        return
 
+    response.raw.decode_content = True
+    for prefix, event, value in ijson.parse(response.raw):
+        if event == "string" and prefix in _EXECUTOR_URL_PREFIXES:
+            yield value
 
-def _fetch_jenkins_builds(jenkins_urls: list[str]) -> list[str]:
-    """Fetch active builds from Jenkins URLs.
 
-    :arg list jenkins_urls: List of Jenkins URLs to check.
+def _fetch_jenkins_builds_from(session: requests.Session, jenkins: str) -> list[str]:
+    """Fetch active builds from a single Jenkins URL.
+
+    :arg Session session: HTTP session used to query Jenkins.
+    :arg str jenkins: Jenkins URL to check.
     :returns: List of active build identifiers (silo-job-build format).
     """
     builds: list[str] = []
 
-    for jenkins in jenkins_urls:
-        jenkins = jenkins.rstrip("/")
-        params = "tree=computer[executors[currentExecutable[url]],oneOffExecutors[currentExecutable[url]]]"
-        params += "&xpath=//url&wrapper=builds"
-        jenkins_url = f"{jenkins}/computer/api/json?{params}"
-
-        try:
-            # Use requests to fetch data
-            response = requests.get(
-                jenkins_url,
-                headers={"Content-Type": "application/json"},
-                timeout=30,
-            )
+    jenkins = jenkins.rstrip("/")
+    params = "tree=computer[executors[currentExecutable[url]],oneOffExecutors[currentExecutable[url]]]"
+    params += "&xpath=//url&wrapper=builds"
+    jenkins_url = f"{jenkins}/computer/api/json?{params}"
 
+    try:
+        with session.get(
+            jenkins_url,
+            timeout=30,
+            stream=ijson is not None,
+        ) as response:
             if response.status_code != 200:
                 print(f"ERROR: Failed to fetch data from {jenkins_url} with status code {response.status_code}")
-                continue
+                return builds
 
             # Determine silo name
             if "jenkins." in jenkins and (".org" in jenkins or ".io" in jenkins):
@@ -56,40 +127,89 @@ def _fetch_jenkins_builds(jenkins_urls: list[str]) -> list[str]:
 
             # Parse JSON and extract build identifiers
             try:
-                data = response.json()
-            except json.JSONDecodeError as e:
+                urls = list(_iter_executor_urls(response))
+            except _JSON_ERRORS as e:
                 print(f"ERROR: Failed to parse JSON from {jenkins_url}: {e}")
-                continue
-
-            for computer in data.get("computer", []):
-                for executor in computer.get("executors", []) + computer.get("oneOffExecutors", []):
-                    current_exec = executor.get("currentExecutable", {})
-                    url = current_exec.get("url")
-                    if url and url != "null":
-                        parts = url.rstrip("/").split("/")
-                        if len(parts) >= 2:
-                            job_name = parts[-2]
-                            build_num = parts[-1]
-                            builds.append(f"{silo}-{job_name}-{build_num}")
-
-        except requests.exceptions.Timeout:
-            print(f"ERROR: Timeout fetching data from {jenkins_url}")
-        except requests.exceptions.RequestException as e:
-            print(f"ERROR: Request failed for {jenkins_url}: {e}")
-        except Exception as e:
-            print(f"ERROR: Unexpected error fetching from {jenkins_url}: {e}")
+                return builds
+
+        # Only the last two path segments (job name, build number) are needed
+        builds = [
+            f"{silo}-{parts[-2]}-{parts[-1]}"
+            for url in urls
+            if url and url != "null" and len(parts := url.rstrip("/").rsplit("/", 2)) >= 2
+        ]
+
+    except requests.exceptions.Timeout:
+        print(f"ERROR: Timeout fetching data from {jenkins_url}")
+    except requests.exceptions.RequestException as e:
+        print(f"ERROR: Request failed for {jenkins_url}: {e}")
+    except Exception as e:
+        print(f"ERROR: Unexpected error fetching from {jenkins_url}: {e}")
+
+    return builds
+
+
+def _fetch_jenkins_builds(jenkins_urls: list[str]) -> list[str]:
+    """Fetch active builds from Jenkins URLs.
+
+    Jenkins instances are queried concurrently; results keep the order of
+    ``jenkins_urls``.
+
+    :arg list jenkins_urls: List of Jenkins URLs to check.
+    :returns: List of active build identifiers (silo-job-build format).
+    """
+    builds: list[str] = []
+    if not jenkins_urls:
+        return builds
+
+    workers = min(_JENKINS_MAX_WORKERS, len(jenkins_urls))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(lambda jenkins: _fetch_jenkins_builds_from(_SESSION, jenkins), jenkins_urls):
+            builds.extend(result)
 
     return builds
 
 
-def _cluster_in_jenkins(cluster_name: str, jenkins_builds: list[str]) -> bool:
+def _join_builds(jenkins_builds: Iterable[str]) -> str:
+    """Join build identifiers into a single string for cluster lookups.
+
+    Newlines never occur in build identifiers or cluster names, so a match
+    can not span two builds.
+
+    :arg iterable jenkins_builds: Active build identifiers.
+    :returns: Newline separated build identifiers.
+    """
+    return "\n".join(jenkins_builds)
+
+
+def _cluster_in_jenkins(cluster_name: str, jenkins_builds: str) -> bool:
     """Check if cluster is in active Jenkins builds.
 
+    A cluster is in use when its name is a substring of any active build
+    identifier. The builds are joined once with _join_builds() so each
+    check is a single substring search.
+
     :arg str cluster_name: Name of the cluster to check.
-    :arg list jenkins_builds: List of active build identifiers.
+    :arg str jenkins_builds: Active build identifiers joined by _join_builds().
     :returns: True if cluster is in use, False otherwise.
     """
-    return cluster_name in " ".join(jenkins_builds)
+    return cluster_name in jenkins_builds
+
+
+def _delete_cluster(cloud: openstack.connection.Connection, cluster_name: str) -> tuple[str, bool]:
+    """Delete a single COE cluster.
+
+    :arg Connection cloud: OpenStack connection.
+    :arg str cluster_name: Name of the cluster to delete.
+    :returns: Tuple of the cluster name and whether it was deleted.
+    """
+    try:
+        cloud.delete_coe_cluster(cluster_name)
+    except OpenStackCloudException as e:
+        print(f"ERROR: Failed to delete cluster {cluster_name}: {e}")
+        return cluster_name, False
+    print(f"INFO: Successfully deleted cluster: {cluster_name}")
+    return cluster_name, True
 
 
 def list_clusters(os_cloud: str) -> None:
@@ -127,10 +247,8 @@ def cleanup(os_cloud: str, jenkins_urls: str | None = None) -> None:
     :arg str os_cloud: Cloud name as defined in OpenStack clouds.yaml.
     :arg str jenkins_urls: Space-separated list of Jenkins URLs to check for active builds.
     """
-    # Parse Jenkins URLs
-    jenkins_url_list: list[str] = []
-    if jenkins_urls:
-        jenkins_url_list = [url.strip() for url in jenkins_urls.split() if url.strip()]
+    # Parse Jenkins URLs; split() drops surrounding and repeated whitespace
+    jenkins_url_list = (jenkins_urls or "").split()
 
     if not jenkins_url_list:
         print("WARN: No Jenkins URLs provided, skipping cluster cleanup to be safe")
@@ -141,38 +259,38 @@ def cleanup(os_cloud: str, jenkins_urls: str | None = None) -> None:
     # Fetch active builds from Jenkins
     active_builds = _fetch_jenkins_builds(jenkins_url_list)
     print(f"INFO: Found {len(active_builds)} active builds in Jenkins")
+    unique_builds = set(active_builds)
+    active_builds_joined = _join_builds(unique_builds)
 
     cloud = openstack.connection.from_config(cloud=os_cloud)
 
-    # Fetch COE cluster list
+    # Walk the COE clusters as the SDK yields them, deleting orphans along the way
     try:
-        clusters = cloud.list_coe_clusters()
-        cluster_names = [cluster.name for cluster in clusters]
-
-        print(f"INFO: Found {len(cluster_names)} COE clusters on cloud {os_cloud}")
-
-        # Delete orphaned clusters
-        deleted_count = 0
-        for cluster_name in cluster_names:
-            # Check if cluster is managed (long-lived)
-            if "-managed-prod-k8s-" in cluster_name or "-managed-test-k8s-" in cluster_name:
-                print(f"INFO: Skipping managed cluster: {cluster_name}")
-                continue
-
-            # Check if cluster is in active Jenkins builds
-            if _cluster_in_jenkins(cluster_name, active_builds):
-                print(f"INFO: Cluster {cluster_name} is in use by active build, skipping")
-                continue
-
-            # Delete orphaned cluster
-            print(f"INFO: Deleting orphaned k8s cluster: {cluster_name}")
-            try:
-                cloud.delete_coe_cluster(cluster_name)
-                deleted_count += 1
-                print(f"INFO: Successfully deleted cluster: {cluster_name}")
-            except OpenStackCloudException as e:
-                print(f"ERROR: Failed to delete cluster {cluster_name}: {e}")
-
+        print(f"INFO: Scanning COE clusters on cloud {os_cloud}")
+
+        cluster_count = 0
+        deletions: list[concurrent.futures.Future[tuple[str, bool]]] = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_CLUSTER_DELETE_WORKERS) as executor:
+            for cluster in cloud.list_coe_clusters():
+                cluster_name = cluster.name
+                cluster_count += 1
+
+                # Check if cluster is managed (long-lived)
+                if _MANAGED_RE.search(cluster_name):
+                    print(f"INFO: Skipping managed cluster: {cluster_name}")
+                    continue
+
+                # Check if cluster is in active Jenkins builds
+                if _cluster_in_jenkins(cluster_name, active_builds_joined):
+                    print(f"INFO: Cluster {cluster_name} is in use by active build, skipping")
+                    continue
+
+                # Delete orphaned cluster
+                print(f"INFO: Deleting orphaned k8s cluster: {cluster_name}")
+                deletions.append(executor.submit(_delete_cluster, cloud, cluster_name))
+
+        deleted_count = sum(deletion.result()[1] for deletion in deletions)
+        print(f"INFO: Found {cluster_count} COE clusters on cloud {os_cloud}")
         print(f"INFO: Deleted {deleted_count} orphaned cluster(s)")
 
     except OpenStackCloudException as e:
@@ -10,45 +10,42 @@
 ##############################################################################
 """Python wrapper for autocorrectinfofile shell script."""
 
-import subprocess
+import os
 import sys
 from pathlib import Path
 
+_SCRIPT_NAME = "autocorrectinfofile"
 
-def main():
-    """Execute the autocorrectinfofile shell script with all arguments passed through."""
-    # Try multiple locations for the shell script
-    script_name = "autocorrectinfofile"
-
-    # Location 1: Development - relative to this module (source tree)
-    dev_location = Path(__file__).parent.parent.parent / "shell" / script_name
+# Candidate locations for the shell script, in lookup order
+_CANDIDATES = (
+    # Development - relative to this module (source tree)
+    str(Path(__file__).parent.parent.parent / "shell" / _SCRIPT_NAME),
+    # Installed - in sys.prefix/share/lftools-uv/shell/
+    str(Path(sys.prefix) / "share" / "lftools-uv" / "shell" / _SCRIPT_NAME),
+    # Virtual environment or user install - the base interpreter's prefix
+    str(Path(sys.base_prefix) / "share" / "lftools-uv" / "shell" / _SCRIPT_NAME),
+)
 
-    # Location 2: Installed - in sys.prefix/share/lftools-uv/shell/
-    installed_location = Path(sys.prefix) / "share" / "lftools-uv" / "shell" / script_name
 
-    # Location 3: Virtual environment or user install - check both prefix and base_prefix
-    venv_location = Path(sys.base_prefix) / "share" / "lftools-uv" / "shell" / script_name
-
-    # Try locations in order
-    shell_script = None
-    for location in [dev_location, installed_location, venv_location]:
-        if location.exists():
-            shell_script = location
-            break
+def main():
+    """Execute the autocorrectinfofile shell script with all arguments passed through."""
+    shell_script = next((location for location in _CANDIDATES if os.path.isfile(location)), None)
 
     if shell_script is None:
         print("Error: Shell script not found at any of the following locations:", file=sys.stderr)
-        print(f"  - {dev_location}", file=sys.stderr)
-        print(f"  - {installed_location}", file=sys.stderr)
-        print(f"  - {venv_location}", file=sys.stderr)
+        for location in _CANDIDATES:
+            print(f"  - {location}", file=sys.stderr)
         sys.exit(1)
 
     # Execute the shell script with all command line arguments
-    cmd = [str(shell_script)] + sys.argv[1:]
+    cmd = [shell_script, *sys.argv[1:]]
     try:
-        result = subprocess.run(cmd, check=False)
-        sys.exit(result.returncode)
-    except FileNotFoundError:
+        if os.name == "posix":
+            # Replace this interpreter with the script; nothing runs afterwards
+            os.execv(cmd[0], cmd)
+        # execv does not replace the process on Windows, so wait on a child instead
+        sys.exit(os.spawnv(os.P_WAIT, cmd[0], cmd))
+    except OSError:
         print(f"Error: Could not execute shell script at {shell_script}", file=sys.stderr)
         sys.exit(1)
     except KeyboardInterrupt:
@@ -14,7 +14,13 @@ from pathlib import Path
 
 import platformdirs
 
-from lftools_uv.config import get_lftools_config_dir, get_lftools_config_file
+from lftools_uv.config import LFTOOLS_CONFIG_FILE
+
+# Platform-specific lftools user directories, resolved once for the demo
+USER_CONFIG_DIR = platformdirs.user_config_dir("lftools")
+USER_CACHE_DIR = platformdirs.user_cache_dir("lftools")
+USER_DATA_DIR = platformdirs.user_data_dir("lftools")
+USER_LOG_DIR = platformdirs.user_log_dir("lftools")
 
 
 def main():
@@ -36,9 +42,9 @@ def main():
     old_config_dir = Path.home() / ".config" / "lftools"
     print(f"Old (xdg):        {old_config_dir}")
 
-    # New platformdirs approach (cross-platform)
-    new_config_dir = get_lftools_config_dir()
-    config_file = get_lftools_config_file()
+    # New platformdirs approach (cross-platform), resolved once when lftools_uv.config is imported
+    config_file = LFTOOLS_CONFIG_FILE
+    new_config_dir = Path(config_file).parent
     print(f"New (platformdirs): {new_config_dir}")
     print(f"Config file:        {config_file}")
     print()
@@ -46,10 +52,10 @@ def main():
     # Show platform-specific behavior
     print("🌍 Platform-Specific Directories")
     print("-" * 35)
-    print(f"User Config:  {platformdirs.user_config_dir('lftools')}")
-    print(f"User Cache:   {platformdirs.user_cache_dir('lftools')}")
-    print(f"User Data:    {platformdirs.user_data_dir('lftools')}")
-    print(f"User Logs:    {platformdirs.user_log_dir('lftools')}")
+    print(f"User Config:  {USER_CONFIG_DIR}")
+    print(f"User Cache:   {USER_CACHE_DIR}")
+    print(f"User Data:    {USER_DATA_DIR}")
+    print(f"User Logs:    {USER_LOG_DIR}")
     print()
 
     # Platform-specific explanations
@@ -0,0 +1,24 @@
+# SPDX-License-Identifier: EPL-1.0
+##############################################################################
+# Copyright (c) 2025 The Linux Foundation and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Eclipse Public License v1.0
+# which accompanies this distribution, and is available at
+# http://www.eclipse.org/legal/epl-v10.html
+##############################################################################
+"""Shared pytest fixtures."""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def make_cluster():
+    """Build stand-in COE cluster objects; the code under test only reads ``name``."""
+
+    def _make_cluster(name):
+        return SimpleNamespace(name=name)
+
+    return _make_cluster
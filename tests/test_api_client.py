@@ -11,6 +11,7 @@
 
 import json
 
+import pytest
 import responses
 
 import lftools_uv.api.client as client
@@ -18,47 +19,27 @@ import lftools_uv.api.client as client
 creds = {"authtype": "token", "endpoint": "", "token": "xyz"}
 c = client.RestApi(creds=creds)
 
-
-@responses.activate
-def test_get():
-    responses.add(responses.GET, "https://fakeurl/", json={"success": "get"}, status=200, match_querystring=True)
-    resp = c.get("https://fakeurl/")
-    assert isinstance(resp, tuple)
-    assert resp[1] == {"success": "get"}
+UNICODE_TEST_CASES = [
+    '{"name": "Señor García"}',  # Spanish
+    '{"name": "Müller"}',  # German
+    '{"name": "Dvořák"}',  # Czech
+    '{"name": "日本語"}',  # Japanese
+    '{"name": "Владимир"}',  # Russian
+    '{"name": "François"}',  # French
+    '{"name": "Björk"}',  # Icelandic
+    '{"name": "Łukasz"}',  # Polish
+    '{"user": "māori", "char": "ā"}',  # Maori
+]
 
 
 @responses.activate
-def test_patch():
-    responses.add(
-        responses.PATCH, url="https://fakeurl/", json={"success": "patch"}, status=200, match_querystring=True
-    )
-    resp = c.patch("https://fakeurl/")
+@pytest.mark.parametrize("method, status", [("get", 200), ("patch", 200), ("post", 201), ("put", 200), ("delete", 200)])
+def test_request_methods(method, status):
+    responses.add(method.upper(), "https://fakeurl/", json={"success": method}, status=status)
+    resp = getattr(c, method)("https://fakeurl/")
     assert isinstance(resp, tuple)
-    assert resp[1] == {"success": "patch"}
-
-
-@responses.activate
-def test_post():
-    responses.add(responses.POST, "https://fakeurl/", json={"success": "post"}, status=201, match_querystring=True)
-    resp = c.post("https://fakeurl/")
-    assert isinstance(resp, tuple)
-    assert resp[1] == {"success": "post"}
-
-
-@responses.activate
-def test_put():
-    responses.add(responses.PUT, "https://fakeurl/", json={"success": "put"}, status=200, match_querystring=True)
-    resp = c.put("https://fakeurl/")
-    assert isinstance(resp, tuple)
-    assert resp[1] == {"success": "put"}
-
-
-@responses.activate
-def test_delete():
-    responses.add(responses.DELETE, "https://fakeurl/", json={"success": "delete"}, status=200, match_querystring=True)
-    resp = c.delete("https://fakeurl/")
-    assert isinstance(resp, tuple)
-    assert resp[1] == {"success": "delete"}
+    assert resp[0].status_code == status
+    assert resp[1] == {"success": method}
 
 
 @responses.activate
@@ -87,37 +68,26 @@ def test_post_with_unicode_string_data():
     assert resp[1] == {"success": "unicode"}
 
 
+@pytest.mark.parametrize("test_data", UNICODE_TEST_CASES)
 @responses.activate
-def test_post_with_various_unicode_characters():
+def test_post_with_various_unicode_characters(test_data):
     """Test various Unicode characters from different languages."""
-    unicode_test_cases = [
-        '{"name": "Señor García"}',  # Spanish
-        '{"name": "Müller"}',  # German
-        '{"name": "Dvořák"}',  # Czech
-        '{"name": "日本語"}',  # Japanese
-        '{"name": "Владимир"}',  # Russian
-        '{"name": "François"}',  # French
-        '{"name": "Björk"}',  # Icelandic
-        '{"name": "Łukasz"}',  # Polish
-        '{"user": "māori", "char": "ā"}',  # Maori
-    ]
-
-    for test_data in unicode_test_cases:
-
-        def request_callback(request):
-            # Verify proper UTF-8 encoding
-            assert isinstance(request.body, bytes)
-            decoded = request.body.decode("utf-8")
-            return (200, {}, json.dumps({"received": decoded}))
-
-        responses.add_callback(
-            responses.POST, "https://fakeurl/unicode-test", callback=request_callback, content_type="application/json"
-        )
-
-        # Should not raise UnicodeEncodeError
-        resp = c.post("https://fakeurl/unicode-test", data=test_data)
-        assert isinstance(resp, tuple)
-        assert resp[0].status_code == 200
+
+    def request_callback(request):
+        # Verify proper UTF-8 encoding
+        assert isinstance(request.body, bytes)
+        decoded = request.body.decode("utf-8")
+        return (200, {}, json.dumps({"received": decoded}))
+
+    responses.add_callback(
+        responses.POST, "https://fakeurl/unicode-test", callback=request_callback, content_type="application/json"
+    )
+
+    # Should not raise UnicodeEncodeError
+    resp = c.post("https://fakeurl/unicode-test", data=test_data)
+    assert isinstance(resp, tuple)
+    assert resp[0].status_code == 200
+    assert resp[1] == {"received": test_data}
 
 
 @responses.activate
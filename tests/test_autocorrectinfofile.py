@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: EPL-1.0
+##############################################################################
+# Copyright (c) 2025 The Linux Foundation and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Eclipse Public License v1.0
+# which accompanies this distribution, and is available at
+# http://www.eclipse.org/legal/epl-v10.html
+##############################################################################
+"""Test the autocorrectinfofile wrapper."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from lftools_uv.shell import autocorrectinfofile
+
+SHELL_SCRIPT = autocorrectinfofile._CANDIDATES[0]
+
+
+@pytest.mark.skipif(not Path(SHELL_SCRIPT).exists(), reason="requires the source tree shell scripts")
+@patch("lftools_uv.shell.autocorrectinfofile.os.execv")
+def test_main_execs_shell_script(mock_execv, monkeypatch):
+    """Test that the wrapper replaces itself with the shell script."""
+    monkeypatch.setattr(autocorrectinfofile.os, "name", "posix")
+    monkeypatch.setattr("sys.argv", ["autocorrectinfofile", "INFO.yaml", "--fix"])
+    mock_execv.side_effect = SystemExit(0)
+
+    with pytest.raises(SystemExit):
+        autocorrectinfofile.main()
+
+    mock_execv.assert_called_once_with(SHELL_SCRIPT, [SHELL_SCRIPT, "INFO.yaml", "--fix"])
+
+
+@pytest.mark.skipif(not Path(SHELL_SCRIPT).exists(), reason="requires the source tree shell scripts")
+@patch("lftools_uv.shell.autocorrectinfofile.os.execv", side_effect=PermissionError)
+def test_main_exec_failure(_mock_execv, monkeypatch, capsys):
+    """Test that a script that cannot be executed exits with an error."""
+    monkeypatch.setattr(autocorrectinfofile.os, "name", "posix")
+    monkeypatch.setattr("sys.argv", ["autocorrectinfofile"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        autocorrectinfofile.main()
+
+    assert exc_info.value.code == 1
+    assert "Could not execute shell script" in capsys.readouterr().err
+
+
+def test_main_script_not_found(monkeypatch, tmp_path, capsys):
+    """Test that every candidate location is reported when the script is missing."""
+    candidates = (str(tmp_path / "one"), str(tmp_path / "two"))
+    monkeypatch.setattr(autocorrectinfofile, "_CANDIDATES", candidates)
+
+    with pytest.raises(SystemExit) as exc_info:
+        autocorrectinfofile.main()
+
+    assert exc_info.value.code == 1
+    err = capsys.readouterr().err
+    assert all(f"  - {candidate}" in err for candidate in candidates)
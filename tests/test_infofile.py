@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: EPL-1.0
+##############################################################################
+# Copyright (c) 2025 The Linux Foundation and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Eclipse Public License v1.0
+# which accompanies this distribution, and is available at
+# http://www.eclipse.org/legal/epl-v10.html
+##############################################################################
+"""Test infofile command."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from lftools_uv.cli.infofile import check_votes, create_info_file, sync_committers
+
+GERRIT_URL = "https://gerrit.example.org/r/"
+
+INFO_YAML = """\
+---
+project: 'releng'
+repositories:
+    - 'old-repo'
+committers:
+    - name: 'Alice Smith'
+      email: 'alice@example.org'
+      company: 'lf'
+      id: 'alice'
+      timezone: 'Unknown/Unknown'
+"""
+
+LDAP_YAML = """\
+committers:
+    - name: Alice Smith
+      email: alice@example.org
+      company: lf
+      id: alice
+      timezone: Unknown/Unknown
+    - name: Jane O'Neil
+      email: jane@example.org
+      company: lf
+      id: joneil
+      timezone: Europe/Dublin
+"""
+
+
+def _write_info(path, committers):
+    lines = ["committers:"] + [f"    - id: '{committer}'" for committer in committers]
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def _reviewers(votes):
+    return [{"username": user, "approvals": {"Code-Review": vote}} for user, vote in votes.items()]
+
+
+@pytest.mark.parametrize(
+    "votes, exit_code",
+    [
+        ({"alice": "+1", "bob": "+2"}, 0),
+        ({"alice": "+1", "carol": "+2", "erin": "+1"}, 0),
+        ({"alice": "+1"}, 1),
+        ({"alice": " 0", "bob": "-1"}, 1),
+    ],
+)
+@pytest.mark.parametrize("level", [logging.INFO, logging.WARNING])
+@patch("lftools_uv.cli.infofile.GerritRestAPI")
+def test_check_votes_majority(mock_rest, tmp_path, caplog, votes, exit_code, level):
+    """Test that a majority of committer votes is detected at any log level."""
+    info_file = _write_info(tmp_path / "INFO.yaml", ["alice", "bob", "carol", "dave"])
+    mock_rest.return_value.get.return_value = _reviewers(votes)
+    caplog.set_level(level, logger="lftools_uv.cli.infofile")
+
+    result = CliRunner().invoke(check_votes, [info_file, GERRIT_URL, "1234"])
+
+    assert result.exit_code == exit_code
+
+
+@patch("lftools_uv.cli.infofile.GerritRestAPI")
+def test_check_votes_tsc(mock_rest, tmp_path, caplog):
+    """Test that the TSC majority is checked after the committer majority."""
+    info_file = _write_info(tmp_path / "INFO.yaml", ["alice", "bob"])
+    tsc_file = _write_info(tmp_path / "TSC.yaml", ["carol", "dave", "erin"])
+    mock_rest.return_value.get.return_value = _reviewers({"alice": "+1", "carol": "+1", "dave": "+1"})
+
+    with caplog.at_level(logging.INFO):
+        result = CliRunner().invoke(check_votes, [info_file, GERRIT_URL, "1234", "--tsc", tsc_file])
+
+    assert result.exit_code == 0
+    assert "TSC majority reached - auto merging commit" in caplog.text
+    mock_rest.return_value.get.assert_called_once()
+
+
+@patch("lftools_uv.cli.infofile.GerritRestAPI")
+def test_check_votes_tsc_not_reached(mock_rest, tmp_path):
+    """Test that a missing TSC majority fails the check."""
+    info_file = _write_info(tmp_path / "INFO.yaml", ["alice", "bob"])
+    tsc_file = _write_info(tmp_path / "TSC.yaml", ["carol", "dave", "erin"])
+    mock_rest.return_value.get.return_value = _reviewers({"alice": "+1", "carol": "+1"})
+
+    result = CliRunner().invoke(check_votes, [info_file, GERRIT_URL, "1234", "--tsc", tsc_file])
+
+    assert result.exit_code == 1
+
+
+def test_create_info_file_empty(caplog):
+    """Test that an empty INFO file is emitted as a single YAML document."""
+    with caplog.at_level(logging.INFO):
+        result = CliRunner().invoke(create_info_file, ["gerrit.example.org", "releng/builder", "--empty"])
+
+    assert result.exit_code == 0
+    assert len(caplog.records) == 1
+    info = yaml.safe_load(caplog.records[0].getMessage())
+    assert info["project"] == "releng_builder"
+    assert info["repositories"] == ["releng/builder"]
+    assert info["committers"][0]["name"] == ""
+    assert info["committers"][1] == {"name": "", "email": "", "company": "", "id": ""}
+    assert info["tsc"]["approval"] == "missing"
+
+
+def test_sync_committers_appends_ldap_entry(tmp_path):
+    """Test that the LDAP entry is appended with single-quoted values."""
+    info_file = tmp_path / "INFO.yaml"
+    info_file.write_text(INFO_YAML)
+    ldap_file = tmp_path / "ldap.yaml"
+    ldap_file.write_text(LDAP_YAML)
+
+    result = CliRunner().invoke(
+        sync_committers, [str(info_file), str(ldap_file), "joneil", "--repo", "releng/builder"], obj={}
+    )
+
+    assert result.exit_code == 0
+    assert info_file.read_text() == (
+        INFO_YAML.replace("'old-repo'", "'releng/builder'")
+        + "    - name: 'Jane O''Neil'\n"
+        + "      company: 'lf'\n"
+        + "      email: 'jane@example.org'\n"
+        + "      id: 'joneil'\n"
+        + "      timezone: 'Europe/Dublin'\n"
+    )
+
+
+def test_sync_committers_existing_committer(tmp_path):
+    """Test that a committer already in INFO.yaml leaves the file untouched."""
+    info_file = tmp_path / "INFO.yaml"
+    info_file.write_text(INFO_YAML)
+    ldap_file = tmp_path / "ldap.yaml"
+    ldap_file.write_text(LDAP_YAML)
+
+    result = CliRunner().invoke(sync_committers, [str(info_file), str(ldap_file), "alice"], obj={})
+
+    assert result.exit_code == 0
+    assert info_file.read_text() == INFO_YAML
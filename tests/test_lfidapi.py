@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: EPL-1.0
+##############################################################################
+# Copyright (c) 2025 The Linux Foundation and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Eclipse Public License v1.0
+# which accompanies this distribution, and is available at
+# http://www.eclipse.org/legal/epl-v10.html
+##############################################################################
+"""Test the LFID API helpers."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+import responses
+
+from lftools_uv import lfidapi
+
+LFID_URL = "https://lfid.example.org/groups/"
+
+
+@pytest.fixture(autouse=True)
+def _mock_oauth(monkeypatch):
+    monkeypatch.setattr(lfidapi, "_cached_headers", None)
+    with patch("lftools_uv.lfidapi.oauth_helper", return_value=("token", LFID_URL)):
+        yield
+
+
+@responses.activate
+def test_search_members_single_request():
+    """Test that members are listed with a single GET."""
+    responses.add(
+        responses.GET,
+        f"{LFID_URL}releng",
+        json={"members": [{"username": "jdoe", "mail": "jdoe@example.org"}]},
+        status=200,
+    )
+
+    members = lfidapi.helper_search_members("releng")
+
+    assert members == [{"username": "jdoe", "mail": "jdoe@example.org"}]
+    assert len(responses.calls) == 1
+
+
+def test_auth_headers_reused_per_token():
+    """Test that the authorization headers are rebuilt only for a new token."""
+    first, url = lfidapi._auth_headers()
+    second, _ = lfidapi._auth_headers()
+
+    assert url == LFID_URL
+    assert first == {"Authorization": "Bearer token"}
+    assert second is first
+
+    with patch("lftools_uv.lfidapi.oauth_helper", return_value=("token-2", LFID_URL)):
+        third, _ = lfidapi._auth_headers()
+
+    assert third == {"Authorization": "Bearer token-2"}
+
+
+@responses.activate
+def test_search_members_missing_group():
+    """Test that a missing group exits with an error."""
+    responses.add(responses.GET, f"{LFID_URL}missing", status=404)
+
+    with pytest.raises(SystemExit) as exc_info:
+        lfidapi.helper_search_members("missing")
+
+    assert exc_info.value.code == 1
+
+
+@responses.activate
+def test_create_group_already_exists(caplog):
+    """Test that an existing group is reported without posting a new one."""
+    responses.add(responses.GET, f"{LFID_URL}releng", status=200)
+
+    lfidapi.helper_create_group("releng")
+
+    assert "Group releng already exists" in caplog.text
+    assert [call.request.method for call in responses.calls] == ["GET"]
+
+
+@responses.activate
+def test_create_group_missing():
+    """Test that a missing group is created after the existence check."""
+    responses.add(responses.GET, f"{LFID_URL}releng", status=404)
+    responses.add(responses.POST, f"{LFID_URL}/", status=200)
+
+    lfidapi.helper_create_group("releng")
+
+    assert [call.request.method for call in responses.calls] == ["GET", "POST"]
+    assert json.loads(responses.calls[1].request.body) == {"title": "releng", "type": "group"}
+
+
+@patch("lftools_uv.lfidapi.helper_user")
+@patch("lftools_uv.lfidapi.helper_search_members")
+def test_match_ldap_to_info(mock_search_members, mock_helper_user, tmp_path):
+    """Test that group membership is synced to the committers in INFO.yaml."""
+    info_file = tmp_path / "INFO.yaml"
+    info_file.write_text("committers:\n    - id: 'alice'\n    - id: 'carol'\n")
+    mock_search_members.return_value = [
+        {"username": "alice"},
+        {"username": "bob"},
+        {"username": "lfservices_releng"},
+    ]
+
+    lfidapi.helper_match_ldap_to_info(str(info_file), "releng", githuborg="", noop=False)
+
+    assert mock_helper_user.call_args_list == [
+        (("bob", "releng", "--delete"),),
+        (("carol", "releng", ""),),
+    ]
+
+
+@responses.activate
+@patch("lftools_uv.lfidapi.validate_email", wraps=lfidapi.validate_email)
+def test_invite_skips_dns_lookup(mock_validate_email):
+    """Test that invites validate email syntax without a DNS deliverability check."""
+    responses.add(responses.POST, f"{LFID_URL}releng/invite", status=200)
+
+    lfidapi.helper_invite("jdoe@example.org", "releng")
+
+    mock_validate_email.assert_called_once_with("jdoe@example.org", check_deliverability=False)
+    assert len(responses.calls) == 1
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: EPL-1.0
+##############################################################################
+# Copyright (c) 2025 The Linux Foundation and others.
+#
+# All rights reserved. This program and the accompanying materials
+# are made available under the terms of the Eclipse Public License v1.0
+# which accompanies this distribution, and is available at
+# http://www.eclipse.org/legal/epl-v10.html
+##############################################################################
+"""Test the LFID API OAuth2 helper."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lftools_uv import oauth2_helper
+
+
+@pytest.fixture(autouse=True)
+def _reset_token_cache(monkeypatch):
+    monkeypatch.setattr(oauth2_helper, "_cached_credentials", None)
+
+
+@patch("lftools_uv.oauth2_helper.config.get_setting", return_value="https://lfid.example.org/")
+@patch("lftools_uv.oauth2_helper.Credentials")
+def test_oauth_helper_reuses_valid_token(mock_credentials, _mock_get_setting):
+    """Test that a still-valid access token is not refreshed again."""
+    credentials = MagicMock(token="token-1", valid=True)
+    mock_credentials.return_value = credentials
+
+    assert oauth2_helper.oauth_helper() == ("token-1", "https://lfid.example.org/")
+    assert oauth2_helper.oauth_helper() == ("token-1", "https://lfid.example.org/")
+
+    credentials.refresh.assert_called_once()
+
+
+@patch("lftools_uv.oauth2_helper.config.get_setting", return_value="https://lfid.example.org/")
+@patch("lftools_uv.oauth2_helper.Credentials")
+def test_oauth_helper_refreshes_expired_token(mock_credentials, _mock_get_setting):
+    """Test that an expired access token triggers a new refresh."""
+    expired = MagicMock(token="token-1", valid=False)
+    fresh = MagicMock(token="token-2", valid=True)
+    mock_credentials.side_effect = [expired, fresh]
+
+    assert oauth2_helper.oauth_helper()[0] == "token-1"
+    assert oauth2_helper.oauth_helper()[0] == "token-2"
+
+    expired.refresh.assert_called_once()
+    fresh.refresh.assert_called_once()
@@ -105,6 +105,27 @@ def test_fetch_jenkins_builds_null_url():
     assert "production-valid-job-100" in builds
 
 
+@responses.activate
+def test_fetch_jenkins_builds_folder_job():
+    """Test that builds of jobs inside folders use the last job name and build number."""
+    jenkins_url = "https://jenkins.example.org"
+
+    responses.add(
+        responses.GET,
+        f"{jenkins_url}/computer/api/json",
+        json={
+            "computer": [
+                {"executors": [{"currentExecutable": {"url": f"{jenkins_url}/job/releng/job/verify-job/42/"}}]}
+            ]
+        },
+        status=200,
+    )
+
+    builds = os_cluster._fetch_jenkins_builds([jenkins_url])
+
+    assert builds == ["production-verify-job-42"]
+
+
 @responses.activate
 def test_fetch_jenkins_builds_http_error():
     """Test handling of HTTP errors when fetching Jenkins builds."""
@@ -162,6 +183,61 @@ def test_fetch_jenkins_builds_invalid_json(capsys):
     assert "ERROR" in captured.out
 
 
+@responses.activate
+@pytest.mark.parametrize("streaming", [True, False])
+def test_fetch_jenkins_builds_idle_executors(streaming, monkeypatch):
+    """Test that idle executors (null currentExecutable) are skipped with and without ijson."""
+    if streaming:
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(os_cluster, "ijson", None)
+    jenkins_url = "https://jenkins.example.org"
+    api_url = f"{jenkins_url}/computer/api/json"
+
+    jenkins_response = {
+        "computer": [
+            {
+                "executors": [
+                    {"currentExecutable": None},
+                    {"currentExecutable": {"url": "https://jenkins.example.org/job/busy-job/7/"}},
+                ],
+                "oneOffExecutors": [{"currentExecutable": {"url": "https://jenkins.example.org/job/flyweight/8/"}}],
+            },
+            {"executors": [{}]},
+        ]
+    }
+
+    responses.add(
+        responses.GET,
+        api_url,
+        json=jenkins_response,
+        status=200,
+    )
+
+    builds = os_cluster._fetch_jenkins_builds([jenkins_url])
+
+    assert builds == ["production-busy-job-7", "production-flyweight-8"]
+
+
+@responses.activate
+def test_fetch_jenkins_builds_invalid_json_without_ijson(capsys, monkeypatch):
+    """Test handling of invalid JSON when the whole response is decoded at once."""
+    monkeypatch.setattr(os_cluster, "ijson", None)
+    jenkins_url = "https://jenkins.example.org"
+
+    responses.add(
+        responses.GET,
+        f"{jenkins_url}/computer/api/json",
+        body="not valid json",
+        status=200,
+    )
+
+    builds = os_cluster._fetch_jenkins_builds([jenkins_url])
+
+    assert builds == []
+    assert "Failed to parse JSON" in capsys.readouterr().out
+
+
 @responses.activate
 def test_fetch_jenkins_builds_multiple_urls():
     """Test fetching builds from multiple Jenkins URLs."""
@@ -203,31 +279,64 @@ def test_fetch_jenkins_builds_multiple_urls():
     assert "production-job2-222" in builds
 
 
+@responses.activate
+def test_fetch_jenkins_builds_preserves_url_order():
+    """Test that builds fetched concurrently keep the order of the Jenkins URLs."""
+    jenkins_urls = [f"https://jenkins.example.com/silo{i}" for i in range(5)]
+
+    for i, jenkins_url in enumerate(jenkins_urls):
+        responses.add(
+            responses.GET,
+            f"{jenkins_url}/computer/api/json",
+            json={
+                "computer": [
+                    {
+                        "executors": [{"currentExecutable": {"url": f"{jenkins_url}/job/job{i}/{i}/"}}],
+                        "oneOffExecutors": [],
+                    }
+                ]
+            },
+            status=200,
+        )
+
+    builds = os_cluster._fetch_jenkins_builds(jenkins_urls)
+
+    assert builds == [f"silo{i}-job{i}-{i}" for i in range(5)]
+
+
 def test_cluster_in_jenkins():
     """Test checking if cluster is in active Jenkins builds."""
-    jenkins_builds = [
-        "production-build-job-123",
-        "sandbox-test-job-456",
-        "production-deploy-job-789",
-    ]
+    jenkins_builds = os_cluster._join_builds(
+        [
+            "production-build-job-123",
+            "sandbox-test-job-456",
+            "production-deploy-job-789",
+        ]
+    )
 
     assert os_cluster._cluster_in_jenkins("build-job-123", jenkins_builds) is True
     assert os_cluster._cluster_in_jenkins("test-job-456", jenkins_builds) is True
+    assert os_cluster._cluster_in_jenkins("build-job", jenkins_builds) is True
     assert os_cluster._cluster_in_jenkins("missing-cluster", jenkins_builds) is False
 
 
+def test_cluster_in_jenkins_does_not_match_across_builds():
+    """Test that a cluster name spanning two build identifiers is not a match."""
+    jenkins_builds = os_cluster._join_builds(["production-build-job-123", "sandbox-test-job-456"])
+
+    assert os_cluster._cluster_in_jenkins("123 sandbox", jenkins_builds) is False
+
+
 @patch("lftools_uv.openstack.cluster.openstack.connection.from_config")
-def test_list_clusters(mock_from_config, capsys):
+def test_list_clusters(mock_from_config, capsys, make_cluster):
     """Test listing COE clusters."""
     # Mock OpenStack connection
     mock_cloud = MagicMock()
     mock_from_config.return_value = mock_cloud
 
     # Mock cluster objects
-    mock_cluster1 = MagicMock()
-    mock_cluster1.name = "test-cluster-1"
-    mock_cluster2 = MagicMock()
-    mock_cluster2.name = "test-cluster-2"
+    mock_cluster1 = make_cluster("test-cluster-1")
+    mock_cluster2 = make_cluster("test-cluster-2")
 
     mock_cloud.list_coe_clusters.return_value = [mock_cluster1, mock_cluster2]
 
@@ -309,7 +418,7 @@ def test_cleanup_empty_jenkins_urls(mock_from_config, mock_fetch_builds, capsys)
 
 @patch("lftools_uv.openstack.cluster._fetch_jenkins_builds")
 @patch("lftools_uv.openstack.cluster.openstack.connection.from_config")
-def test_cleanup_orphaned_clusters(mock_from_config, mock_fetch_builds, capsys):
+def test_cleanup_orphaned_clusters(mock_from_config, mock_fetch_builds, capsys, make_cluster):
     """Test cleanup of orphaned clusters."""
     # Mock Jenkins builds
     mock_fetch_builds.return_value = ["production-active-job-123"]
@@ -319,12 +428,9 @@ def test_cleanup_orphaned_clusters(mock_from_config, mock_fetch_builds, capsys):
     mock_from_config.return_value = mock_cloud
 
     # Mock cluster objects
-    mock_cluster1 = MagicMock()
-    mock_cluster1.name = "orphaned-cluster-1"
-    mock_cluster2 = MagicMock()
-    mock_cluster2.name = "active-job-123"
-    mock_cluster3 = MagicMock()
-    mock_cluster3.name = "orphaned-cluster-2"
+    mock_cluster1 = make_cluster("orphaned-cluster-1")
+    mock_cluster2 = make_cluster("active-job-123")
+    mock_cluster3 = make_cluster("orphaned-cluster-2")
 
     mock_cloud.list_coe_clusters.return_value = [mock_cluster1, mock_cluster2, mock_cluster3]
 
@@ -337,6 +443,7 @@ def test_cleanup_orphaned_clusters(mock_from_config, mock_fetch_builds, capsys):
     assert "Deleting orphaned k8s cluster: orphaned-cluster-2" in captured.out
     assert "Cluster active-job-123 is in use by active build" in captured.out
     assert "Deleted 2 orphaned cluster(s)" in captured.out
+    assert "Found 3 COE clusters on cloud test-cloud" in captured.out
 
     # Verify delete was called for orphaned clusters
     assert mock_cloud.delete_coe_cluster.call_count == 2
@@ -346,7 +453,7 @@ def test_cleanup_orphaned_clusters(mock_from_config, mock_fetch_builds, capsys):
 
 @patch("lftools_uv.openstack.cluster._fetch_jenkins_builds")
 @patch("lftools_uv.openstack.cluster.openstack.connection.from_config")
-def test_cleanup_preserves_managed_clusters(mock_from_config, mock_fetch_builds, capsys):
+def test_cleanup_preserves_managed_clusters(mock_from_config, mock_fetch_builds, capsys, make_cluster):
     """Test that managed clusters are preserved during cleanup."""
     # Mock Jenkins builds (empty - no active builds)
     mock_fetch_builds.return_value = []
@@ -356,12 +463,9 @@ def test_cleanup_preserves_managed_clusters(mock_from_config, mock_fetch_builds,
     mock_from_config.return_value = mock_cloud
 
     # Mock cluster objects including managed ones
-    mock_cluster1 = MagicMock()
-    mock_cluster1.name = "orphaned-cluster"
-    mock_cluster2 = MagicMock()
-    mock_cluster2.name = "project-managed-prod-k8s-cluster"
-    mock_cluster3 = MagicMock()
-    mock_cluster3.name = "project-managed-test-k8s-cluster"
+    mock_cluster1 = make_cluster("orphaned-cluster")
+    mock_cluster2 = make_cluster("project-managed-prod-k8s-cluster")
+    mock_cluster3 = make_cluster("project-managed-test-k8s-cluster")
 
     mock_cloud.list_coe_clusters.return_value = [mock_cluster1, mock_cluster2, mock_cluster3]
 
@@ -381,7 +485,7 @@ def test_cleanup_preserves_managed_clusters(mock_from_config, mock_fetch_builds,
 
 @patch("lftools_uv.openstack.cluster._fetch_jenkins_builds")
 @patch("lftools_uv.openstack.cluster.openstack.connection.from_config")
-def test_cleanup_delete_error(mock_from_config, mock_fetch_builds, capsys):
+def test_cleanup_delete_error(mock_from_config, mock_fetch_builds, capsys, make_cluster):
     """Test handling of errors when deleting clusters."""
     from openstack.cloud.exc import OpenStackCloudException
 
@@ -393,8 +497,7 @@ def test_cleanup_delete_error(mock_from_config, mock_fetch_builds, capsys):
     mock_from_config.return_value = mock_cloud
 
     # Mock cluster
-    mock_cluster = MagicMock()
-    mock_cluster.name = "orphaned-cluster"
+    mock_cluster = make_cluster("orphaned-cluster")
     mock_cloud.list_coe_clusters.return_value = [mock_cluster]
 
     # Make delete raise an error
@@ -408,6 +511,34 @@ def test_cleanup_delete_error(mock_from_config, mock_fetch_builds, capsys):
     assert "Deleted 0 orphaned cluster(s)" in captured.out
 
 
+@patch("lftools_uv.openstack.cluster._fetch_jenkins_builds")
+@patch("lftools_uv.openstack.cluster.openstack.connection.from_config")
+def test_cleanup_delete_error_does_not_abort_others(mock_from_config, mock_fetch_builds, capsys, make_cluster):
+    """Test that one failed delete does not stop the other concurrent deletes."""
+    from openstack.cloud.exc import OpenStackCloudException
+
+    mock_fetch_builds.return_value = []
+    mock_cloud = MagicMock()
+    mock_from_config.return_value = mock_cloud
+
+    mock_cloud.list_coe_clusters.return_value = [make_cluster(name) for name in ("orphan-1", "orphan-2", "orphan-3")]
+
+    def delete(name):
+        if name == "orphan-2":
+            raise OpenStackCloudException("Delete failed")
+
+    mock_cloud.delete_coe_cluster.side_effect = delete
+
+    os_cluster.cleanup("test-cloud", jenkins_urls="https://jenkins.example.org")
+
+    captured = capsys.readouterr()
+    assert "ERROR: Failed to delete cluster orphan-2" in captured.out
+    assert "Successfully deleted cluster: orphan-1" in captured.out
+    assert "Successfully deleted cluster: orphan-3" in captured.out
+    assert "Deleted 2 orphaned cluster(s)" in captured.out
+    assert mock_cloud.delete_coe_cluster.call_count == 3
+
+
 @patch("lftools_uv.openstack.cluster._fetch_jenkins_builds")
 @patch("lftools_uv.openstack.cluster.openstack.connection.from_config")
 def test_cleanup_multiple_jenkins_urls(mock_from_config, mock_fetch_builds, capsys):